@@ -39,8 +39,8 @@ async def init_super_admin():
                 "password": auth_service.hash_password("SuperAdmin2024!"),
                 "role": UserRole.SUPER_ADMIN.value,
                 "email_verified": True,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "created_at": datetime.now(timezone.utc),
+                "updated_at": datetime.now(timezone.utc)
             }
             
             await db.users.insert_one(super_admin_data)
@@ -56,6 +56,9 @@ async def init_super_admin():
         # Ensure database indexes for performance
         await create_indexes(db)
         
+        # Convert dates written by older releases as ISO strings
+        await migrate_legacy_dates(db)
+        
     except Exception as e:
         print(f"❌ Error initializing admin: {e}")
         
@@ -81,6 +84,7 @@ async def create_indexes(db):
         await db.tasks.create_index([("status", 1)])
         await db.tasks.create_index([("task_type", 1)])
         await db.tasks.create_index([("due_date", 1)])
+        await db.tasks.create_index([("status", 1), ("due_date", 1)])
         
         # Invitation collection indexes
         await db.user_invitations.create_index([("invitation_token", 1)], unique=True)
@@ -108,6 +112,38 @@ async def create_indexes(db):
     except Exception as e:
         print(f"⚠️  Warning: Could not create some indexes: {e}")
 
+# Date fields that older releases stored as ISO strings
+LEGACY_DATE_FIELDS = {
+    "users": ["created_at", "updated_at", "last_login"],
+    "employees": ["start_date", "birthday", "exit_date", "created_at", "updated_at"],
+    "tasks": ["due_date", "completed_date", "created_at", "updated_at"],
+}
+
+async def migrate_legacy_dates(db):
+    """Convert ISO-string date fields to native BSON dates so range queries and indexes see them"""
+    # Each release's conversion only has to scan the collections once
+    if await db.migrations.find_one({"_id": "legacy_dates"}):
+        return
+    
+    complete = True
+    for collection, fields in LEGACY_DATE_FIELDS.items():
+        for field in fields:
+            try:
+                # Unparseable values are left as they are rather than aborting the update part-way
+                result = await db[collection].update_many(
+                    {field: {"$type": "string"}},
+                    [{"$set": {field: {"$convert": {"input": f"${field}", "to": "date", "onError": f"${field}"}}}}]
+                )
+                if result.modified_count:
+                    print(f"✅ Converted {result.modified_count} {collection}.{field} values to dates")
+                    
+            except Exception as e:
+                complete = False
+                print(f"⚠️  Warning: Could not migrate legacy {collection}.{field} dates: {e}")
+    
+    if complete:
+        await db.migrations.insert_one({"_id": "legacy_dates", "completed_at": datetime.now(timezone.utc)})
+
 async def create_sample_data():
     """Create sample data for development/testing"""
     mongo_url = os.environ['MONGO_URL']
@@ -129,10 +165,10 @@ async def create_sample_data():
                     "email": "alice.johnson@brandingpioneers.com",
                     "department": "Engineering",
                     "manager": "Tech Lead",
-                    "start_date": datetime(2024, 1, 15, tzinfo=timezone.utc).isoformat(),
+                    "start_date": datetime(2024, 1, 15, tzinfo=timezone.utc),
                     "status": "active",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "updated_at": datetime.now(timezone.utc).isoformat()
+                    "created_at": datetime.now(timezone.utc),
+                    "updated_at": datetime.now(timezone.utc)
                 },
                 {
                     "id": str(uuid.uuid4()),
@@ -141,10 +177,10 @@ async def create_sample_data():
                     "email": "bob.smith@brandingpioneers.com",
                     "department": "Design",
                     "manager": "Design Lead",
-                    "start_date": datetime(2024, 2, 1, tzinfo=timezone.utc).isoformat(),
+                    "start_date": datetime(2024, 2, 1, tzinfo=timezone.utc),
                     "status": "onboarding",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "updated_at": datetime.now(timezone.utc).isoformat()
+                    "created_at": datetime.now(timezone.utc),
+                    "updated_at": datetime.now(timezone.utc)
                 },
                 {
                     "id": str(uuid.uuid4()),
@@ -153,10 +189,10 @@ async def create_sample_data():
                     "email": "carol.brown@brandingpioneers.com",
                     "department": "HR",
                     "manager": "HR Director",
-                    "start_date": datetime(2023, 6, 10, tzinfo=timezone.utc).isoformat(),
+                    "start_date": datetime(2023, 6, 10, tzinfo=timezone.utc),
                     "status": "active",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "updated_at": datetime.now(timezone.utc).isoformat()
+                    "created_at": datetime.now(timezone.utc),
+                    "updated_at": datetime.now(timezone.utc)
                 }
             ]
             
@@ -1,13 +1,14 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Request, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Request, BackgroundTasks, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import Response
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, ValidationError, field_validator
 from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone, timedelta
@@ -18,9 +19,12 @@ from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import io
+import re
+import json
+import hashlib
 import pandas as pd
 import tempfile
 import shutil
@@ -41,7 +45,7 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
 # JWT Configuration
@@ -49,6 +53,16 @@ SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-change-this')
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# List endpoints page through results in the database; AI endpoints sample
+DEFAULT_PAGE_LIMIT = 1000
+AI_SAMPLE_SIZE = 200
+
+# Validation patterns
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 # Create the main app
 app = FastAPI(title="HR Onboarding & Exit System - Enhanced Security")
 api_router = APIRouter(prefix="/api")
@@ -74,6 +88,9 @@ class EmployeeStatus(str, Enum):
     EXITED = "exited"
     INACTIVE = "inactive"
 
+_EMP_STATUS_VALUES = frozenset(s.value for s in EmployeeStatus)
+_EMP_STATUS_ERR = f"Invalid status. Must be one of: {', '.join(s.value for s in EmployeeStatus)}"
+
 class TaskStatus(str, Enum):
     PENDING = "pending"
     COMPLETED = "completed"
@@ -170,6 +187,51 @@ class EmployeeUpdate(BaseModel):
     birthday: Optional[datetime] = None
     exit_date: Optional[datetime] = None
 
+class EmployeeProfileUpdate(BaseModel):
+    """Loosely-typed profile update; validation errors are reported as 400s by the endpoint"""
+    name: Optional[str] = None
+    employee_id: Optional[str] = None
+    email: Optional[str] = None
+    department: Optional[str] = None
+    position: Optional[str] = None
+    manager: Optional[str] = None
+    phone: Optional[str] = None
+    status: Optional[str] = None
+    start_date: Optional[datetime] = None
+    birthday: Optional[datetime] = None
+    exit_date: Optional[datetime] = None
+
+    @field_validator('start_date', 'birthday', 'exit_date', mode='before')
+    @classmethod
+    def parse_iso_date(cls, value, info):
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                raise ValueError(f"Invalid date format for {info.field_name}")
+        return value
+
+    @field_validator('email')
+    @classmethod
+    def check_email(cls, value):
+        if value is not None and not EMAIL_RE.match(value):
+            raise ValueError("Invalid email format")
+        return value
+
+    @field_validator('status')
+    @classmethod
+    def check_status(cls, value):
+        if value is not None and value not in _EMP_STATUS_VALUES:
+            raise ValueError(_EMP_STATUS_ERR)
+        return value
+
+    @field_validator('name')
+    @classmethod
+    def check_name(cls, value):
+        if value is not None and not value.strip():
+            raise ValueError("Name cannot be empty")
+        return value
+
 class Task(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     employee_id: str
@@ -269,16 +331,8 @@ DEFAULT_EXIT_TASKS = [
 ]
 
 # Helper functions
-def prepare_for_mongo(data):
-    """Convert datetime objects to ISO strings for MongoDB storage"""
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
-    return data
-
 def parse_from_mongo(item):
-    """Parse datetime strings back from MongoDB"""
+    """Parse legacy ISO datetime strings back from MongoDB (new writes store native dates)"""
     if isinstance(item, dict):
         for key, value in item.items():
             if isinstance(value, str) and key.endswith(('_date', '_at')) and 'T' in value:
@@ -291,11 +345,12 @@ def parse_from_mongo(item):
 async def create_default_tasks_for_employee(employee_id: str, task_type: TaskType, user_email: str):
     """Create default tasks when an employee starts onboarding or exit process"""
     templates = DEFAULT_ONBOARDING_TASKS if task_type == TaskType.ONBOARDING else DEFAULT_EXIT_TASKS
+    now = datetime.now(timezone.utc)
     
     for template in templates:
         due_date = None
         if template.get("default_due_days"):
-            due_date = datetime.now(timezone.utc) + timedelta(days=template["default_due_days"])
+            due_date = now + timedelta(days=template["default_due_days"])
         
         task = Task(
             employee_id=employee_id,
@@ -305,8 +360,7 @@ async def create_default_tasks_for_employee(employee_id: str, task_type: TaskTyp
             due_date=due_date,
             assigned_by=user_email
         )
-        task_dict = prepare_for_mongo(task.dict())
-        await db.tasks.insert_one(task_dict)
+        await db.tasks.insert_one(task.dict())
 
 async def get_client_info(request: Request):
     """Extract client info for audit logging"""
@@ -315,6 +369,43 @@ async def get_client_info(request: Request):
         "user_agent": request.headers.get("user-agent", None)
     }
 
+async def _apply_employee_update(employee: dict, update_dict: dict, current_user: dict, request: Request, action: str):
+    """Shared write path for the employee update endpoints"""
+    employee_id = employee["id"]
+    
+    # Check for email uniqueness if being updated
+    if 'email' in update_dict and update_dict['email'] != employee.get('email'):
+        existing_email = await db.employees.find_one({"email": update_dict['email'], "id": {"$ne": employee_id}})
+        if existing_email:
+            raise HTTPException(status_code=400, detail="Email already exists")
+    
+    # Check for employee_id uniqueness if being updated
+    if 'employee_id' in update_dict and update_dict['employee_id'] != employee.get('employee_id'):
+        existing_emp_id = await db.employees.find_one({"employee_id": update_dict['employee_id'], "id": {"$ne": employee_id}})
+        if existing_emp_id:
+            raise HTTPException(status_code=400, detail="Employee ID already exists")
+    
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    
+    # Create exit tasks if status is changing to exiting
+    if update_dict.get("status") == EmployeeStatus.EXITING and employee.get("status") != EmployeeStatus.EXITING:
+        await create_default_tasks_for_employee(employee_id, TaskType.EXIT, current_user["email"])
+    
+    await db.employees.update_one({"id": employee_id}, {"$set": update_dict})
+    
+    # Log action
+    client_info = await get_client_info(request)
+    await auth_service.log_action(
+        user_id=current_user["id"],
+        action=action,
+        resource="employee",
+        details={"employee_id": employee_id, "updates": update_dict},
+        **client_info
+    )
+    
+    updated_employee = await db.employees.find_one({"id": employee_id})
+    return Employee(**parse_from_mongo(updated_employee))
+
 # ============================================================================
 # AUTHENTICATION & USER MANAGEMENT ROUTES
 # ============================================================================
@@ -342,7 +433,6 @@ async def register(user_data: UserCreate, request: Request):
     
     user_dict = user.dict()
     user_dict["password"] = auth_service.hash_password(user_data.password)
-    user_dict = prepare_for_mongo(user_dict)
     
     await db.users.insert_one(user_dict)
     
@@ -365,9 +455,10 @@ async def login(login_data: UserLogin, request: Request):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Update last login
+    now = datetime.now(timezone.utc)
     await db.users.update_one(
         {"id": user["id"]},
-        {"$set": {"last_login": datetime.now(timezone.utc)}}
+        {"$set": {"last_login": now}}
     )
     
     access_token = auth_service.generate_token({"sub": user["email"]})
@@ -390,7 +481,7 @@ async def login(login_data: UserLogin, request: Request):
             user_name=user["name"],
             event_type="login",
             event_details={
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "timestamp": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
                 "ip_address": client_info.get("ip_address", "Unknown"),
                 "user_agent": client_info.get("user_agent", "Unknown")[:50]
             }
@@ -480,10 +571,11 @@ async def change_password(
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     
     # Update password
+    now = datetime.now(timezone.utc)
     new_password_hash = auth_service.hash_password(password_data.new_password)
     await db.users.update_one(
         {"id": current_user["id"]},
-        {"$set": {"password": new_password_hash, "updated_at": datetime.now(timezone.utc)}}
+        {"$set": {"password": new_password_hash, "updated_at": now}}
     )
     
     # Log action
@@ -503,7 +595,7 @@ async def change_password(
             user_name=current_user["name"],
             event_type="password_change",
             event_details={
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "timestamp": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
                 "ip_address": client_info.get("ip_address", "Unknown")
             }
         )
@@ -528,11 +620,25 @@ async def verify_email(token: str, request: Request):
 
 @api_router.get("/admin/users")
 async def get_all_users(
+    request: Request,
+    response: Response = None,
+    email: Optional[str] = None,
     current_user: dict = Depends(auth_service.require_permission(Permission.READ_USER))
 ):
-    """Get all users (Admin only)"""
-    users = await db.users.find({}, {"password": 0}).to_list(1000)
-    return [User(**parse_from_mongo(user)) for user in users]
+    """Get all users (Admin only), or just the one with ?email=; supports If-None-Match revalidation"""
+    # An exact email lookup is served by the unique email index instead of listing everyone
+    query = {"email": email} if email else {}
+    users = await db.users.find(query, {"password": 0}).to_list(1000)
+    payload = jsonable_encoder([User(**parse_from_mongo(user)) for user in users])
+    
+    # A content hash lets clients revalidate a listing they already hold without re-downloading it
+    etag = '"' + hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:32] + '"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+    
+    response.headers.update(cache_headers)
+    return payload
 
 @api_router.put("/admin/users/{user_id}/role")
 async def update_user_role(
@@ -626,10 +732,17 @@ async def delete_user(
 async def get_audit_logs(
     limit: int = 50,
     skip: int = 0,
+    action: Optional[str] = None,
+    resource: Optional[str] = None,
     current_user: dict = Depends(auth_service.require_permission(Permission.VIEW_AUDIT_LOGS))
 ):
-    """Get audit logs (Admin only)"""
-    logs = await db.audit_logs.find().sort("timestamp", -1).skip(skip).limit(limit).to_list(limit)
+    """Get audit logs (Admin only), optionally filtered by action and/or resource"""
+    query = {}
+    if action:
+        query["action"] = action
+    if resource:
+        query["resource"] = resource
+    logs = await db.audit_logs.find(query).sort("timestamp", -1).skip(skip).limit(limit).to_list(limit)
     return [AuditLog(**log) for log in logs]
 
 @api_router.post("/admin/bulk-notification")
@@ -680,8 +793,7 @@ async def create_employee(
         raise HTTPException(status_code=400, detail="Employee ID already exists")
     
     employee = Employee(**employee_data.dict())
-    employee_dict = prepare_for_mongo(employee.dict())
-    await db.employees.insert_one(employee_dict)
+    await db.employees.insert_one(employee.dict())
     
     # Create default onboarding tasks if status is onboarding
     if employee.status == EmployeeStatus.ONBOARDING:
@@ -701,9 +813,16 @@ async def create_employee(
 
 @api_router.get("/employees", response_model=List[Employee])
 async def get_employees(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=DEFAULT_PAGE_LIMIT),
+    skip: int = Query(0, ge=0),
+    with_total: bool = False,
     current_user: dict = Depends(auth_service.require_permission(Permission.READ_EMPLOYEE))
 ):
-    employees = await db.employees.find().to_list(1000)
+    employees = await db.employees.find().skip(skip).limit(limit).to_list(limit)
+    # Counting costs an extra round trip, so only clients that page ask for it
+    if with_total:
+        response.headers["X-Total-Count"] = str(await db.employees.estimated_document_count())
     return [Employee(**parse_from_mongo(emp)) for emp in employees]
 
 @api_router.get("/employees/download-template")
@@ -927,40 +1046,7 @@ async def update_employee(
         raise HTTPException(status_code=404, detail="Employee not found")
     
     update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
-    
-    # Check for email uniqueness if being updated
-    if 'email' in update_dict and update_dict['email'] != employee.get('email'):
-        existing_email = await db.employees.find_one({"email": update_dict['email'], "id": {"$ne": employee_id}})
-        if existing_email:
-            raise HTTPException(status_code=400, detail="Email already exists")
-    
-    # Check for employee_id uniqueness if being updated
-    if 'employee_id' in update_dict and update_dict['employee_id'] != employee.get('employee_id'):
-        existing_emp_id = await db.employees.find_one({"employee_id": update_dict['employee_id'], "id": {"$ne": employee_id}})
-        if existing_emp_id:
-            raise HTTPException(status_code=400, detail="Employee ID already exists")
-    
-    update_dict["updated_at"] = datetime.now(timezone.utc)
-    update_dict = prepare_for_mongo(update_dict)
-    
-    # Create exit tasks if status is changing to exiting
-    if update_data.status == EmployeeStatus.EXITING and employee.get("status") != EmployeeStatus.EXITING:
-        await create_default_tasks_for_employee(employee_id, TaskType.EXIT, current_user["email"])
-    
-    await db.employees.update_one({"id": employee_id}, {"$set": update_dict})
-    
-    # Log action
-    client_info = await get_client_info(request)
-    await auth_service.log_action(
-        user_id=current_user["id"],
-        action="update_employee",
-        resource="employee",
-        details={"employee_id": employee_id, "updates": update_dict},
-        **client_info
-    )
-    
-    updated_employee = await db.employees.find_one({"id": employee_id})
-    return Employee(**parse_from_mongo(updated_employee))
+    return await _apply_employee_update(employee, update_dict, current_user, request, "update_employee")
 
 @api_router.put("/employees/{employee_id}/profile", response_model=Employee)
 async def update_employee_profile(
@@ -975,77 +1061,17 @@ async def update_employee_profile(
         raise HTTPException(status_code=404, detail="Employee not found")
     
     # Validate and process update fields
-    valid_fields = {'name', 'employee_id', 'email', 'department', 'position', 'manager', 'phone', 'start_date', 'birthday', 'status', 'exit_date'}
-    update_dict = {}
-    
-    for field, value in update_data.items():
-        if field in valid_fields and value is not None:
-            # Handle date fields
-            if field in ['start_date', 'birthday', 'exit_date'] and isinstance(value, str):
-                try:
-                    update_dict[field] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                except ValueError:
-                    raise HTTPException(status_code=400, detail=f"Invalid date format for {field}")
-            # Validate email format
-            elif field == 'email':
-                if '@' not in str(value) or '.' not in str(value):
-                    raise HTTPException(status_code=400, detail="Invalid email format")
-                update_dict[field] = value
-            # Validate status enum
-            elif field == 'status':
-                try:
-                    EmployeeStatus(value)  # This will raise ValueError if invalid
-                    update_dict[field] = value
-                except ValueError:
-                    raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {', '.join([s.value for s in EmployeeStatus])}")
-            # Validate name is not empty
-            elif field == 'name':
-                if not str(value).strip():
-                    raise HTTPException(status_code=400, detail="Name cannot be empty")
-                update_dict[field] = value
-            else:
-                update_dict[field] = value
-    
-    # Check for email uniqueness if being updated
-    if 'email' in update_dict and update_dict['email'] != employee.get('email'):
-        existing_email = await db.employees.find_one({"email": update_dict['email'], "id": {"$ne": employee_id}})
-        if existing_email:
-            raise HTTPException(status_code=400, detail="Email already exists")
-    
-    # Check for employee_id uniqueness if being updated
-    if 'employee_id' in update_dict and update_dict['employee_id'] != employee.get('employee_id'):
-        existing_emp_id = await db.employees.find_one({"employee_id": update_dict['employee_id'], "id": {"$ne": employee_id}})
-        if existing_emp_id:
-            raise HTTPException(status_code=400, detail="Employee ID already exists")
-    
-    # Update timestamp
-    update_dict["updated_at"] = datetime.now(timezone.utc)
-    update_dict = prepare_for_mongo(update_dict)
-    
-    # Handle status changes and task creation
-    old_status = employee.get("status")
-    new_status = update_dict.get("status")
-    
-    # Create exit tasks if status is changing to exiting
-    if new_status == EmployeeStatus.EXITING and old_status != EmployeeStatus.EXITING:
-        await create_default_tasks_for_employee(employee_id, TaskType.EXIT, current_user["email"])
-    
-    # Update employee
-    await db.employees.update_one({"id": employee_id}, {"$set": update_dict})
-    
-    # Log action
-    client_info = await get_client_info(request)
-    await auth_service.log_action(
-        user_id=current_user["id"],
-        action="update_employee_profile",
-        resource="employee",
-        details={"employee_id": employee_id, "updates": update_dict},
-        **client_info
-    )
+    try:
+        profile = EmployeeProfileUpdate.model_validate(update_data)
+    except ValidationError as e:
+        error = e.errors()[0]
+        # Name the offending field; pydantic's own messages ("Input should be a valid string") don't
+        field = ".".join(str(part) for part in error["loc"])
+        message = str(error.get("ctx", {}).get("error", error["msg"]))
+        raise HTTPException(status_code=400, detail=f"{field}: {message}" if field else message)
     
-    # Get updated employee
-    updated_employee = await db.employees.find_one({"id": employee_id})
-    return Employee(**parse_from_mongo(updated_employee))
+    update_dict = profile.model_dump(exclude_none=True)
+    return await _apply_employee_update(employee, update_dict, current_user, request, "update_employee_profile")
 
 @api_router.delete("/employees/{employee_id}")
 async def delete_employee(
@@ -1099,10 +1125,10 @@ async def import_employees_from_excel(
         temp_dir = tempfile.mkdtemp()
         temp_file_path = os.path.join(temp_dir, file.filename)
         
-        # Read and save file content
-        content = await file.read()
+        # Stream file content to disk so peak memory stays at one chunk
         with open(temp_file_path, 'wb') as temp_file:
-            temp_file.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                temp_file.write(chunk)
         
         # AI Analysis of the Excel file
         ai_analysis = None
@@ -1207,6 +1233,7 @@ async def import_employees_from_excel(
             )
         
         imported_count = 0
+        imported_employees = []
         errors = []
         ai_analysis_result = None
         
@@ -1217,6 +1244,14 @@ async def import_employees_from_excel(
             except Exception as e:
                 print(f"AI analysis failed: {e}")
         
+        # Look up clashing employee IDs in one query instead of one per row
+        id_column = column_mapping['Employee ID']
+        file_ids = df[id_column].dropna().astype(str).str.strip().unique().tolist()
+        existing_ids = {
+            doc["employee_id"]
+            async for doc in db.employees.find({"employee_id": {"$in": file_ids}}, {"employee_id": 1, "_id": 0})
+        }
+        
         for index, row in df.iterrows():
             try:
                 # Use mapped column names to get data
@@ -1232,8 +1267,7 @@ async def import_employees_from_excel(
                     errors.append(f"Row {index + 2}: Employee ID is required")
                     continue
                     
-                existing = await db.employees.find_one({"employee_id": employee_id_value})
-                if existing:
+                if employee_id_value in existing_ids:
                     errors.append(f"Row {index + 2}: Employee ID {employee_id_value} already exists")
                     continue
                 
@@ -1315,13 +1349,14 @@ async def import_employees_from_excel(
                 employee = Employee(**employee_data)
                 
                 # Save to database
-                employee_dict = prepare_for_mongo(employee.dict())
-                await db.employees.insert_one(employee_dict)
+                await db.employees.insert_one(employee.dict())
+                existing_ids.add(employee_id_value)
                 
                 # Create default onboarding tasks
                 await create_default_tasks_for_employee(employee.id, TaskType.ONBOARDING, current_user["email"])
                 
                 imported_count += 1
+                imported_employees.append({"id": employee.id, "employee_id": employee.employee_id, "name": employee.name})
                 
             except Exception as e:
                 errors.append(f"Row {index + 2}: {str(e)}")
@@ -1348,6 +1383,7 @@ async def import_employees_from_excel(
         result = {
             "message": f"Successfully imported {imported_count} employees",
             "imported_count": imported_count,
+            "imported_employees": imported_employees,
             "total_rows": len(df),
             "errors": errors,
             "ai_analysis": ai_analysis_result,
@@ -1370,8 +1406,7 @@ async def create_task(
     request: Request = None
 ):
     task = Task(**task_data.dict(), assigned_by=current_user["email"])
-    task_dict = prepare_for_mongo(task.dict())
-    await db.tasks.insert_one(task_dict)
+    await db.tasks.insert_one(task.dict())
     
     # Log action
     client_info = await get_client_info(request)
@@ -1389,6 +1424,10 @@ async def create_task(
 async def get_tasks(
     employee_id: Optional[str] = None,
     task_type: Optional[TaskType] = None,
+    response: Response = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=DEFAULT_PAGE_LIMIT),
+    skip: int = Query(0, ge=0),
+    with_total: bool = False,
     current_user: dict = Depends(auth_service.require_permission(Permission.READ_TASK))
 ):
     query = {}
@@ -1397,7 +1436,10 @@ async def get_tasks(
     if task_type:
         query["task_type"] = task_type.value
     
-    tasks = await db.tasks.find(query).to_list(1000)
+    tasks = await db.tasks.find(query).skip(skip).limit(limit).to_list(limit)
+    if with_total:
+        total = await db.tasks.count_documents(query) if query else await db.tasks.estimated_document_count()
+        response.headers["X-Total-Count"] = str(total)
     return [Task(**parse_from_mongo(task)) for task in tasks]
 
 @api_router.get("/tasks/{task_id}", response_model=Task)
@@ -1421,16 +1463,15 @@ async def bulk_update_tasks(
     if not bulk_data.task_ids:
         raise HTTPException(status_code=400, detail="No task IDs provided")
     
+    now = datetime.now(timezone.utc)
     update_dict = {
         "status": bulk_data.status.value,
-        "updated_at": datetime.now(timezone.utc)
+        "updated_at": now
     }
     
     # Set completed_date if tasks are being marked as completed
     if bulk_data.status == TaskStatus.COMPLETED:
-        update_dict["completed_date"] = datetime.now(timezone.utc)
-    
-    update_dict = prepare_for_mongo(update_dict)
+        update_dict["completed_date"] = now
     
     # Use MongoDB's bulk operations for efficiency
     result = await db.tasks.update_many(
@@ -1465,14 +1506,14 @@ async def update_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    now = datetime.now(timezone.utc)
     update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
-    update_dict["updated_at"] = datetime.now(timezone.utc)
+    update_dict["updated_at"] = now
     
     # Set completed_date if task is being marked as completed
     if update_data.status == TaskStatus.COMPLETED and not update_data.completed_date:
-        update_dict["completed_date"] = datetime.now(timezone.utc)
+        update_dict["completed_date"] = now
     
-    update_dict = prepare_for_mongo(update_dict)
     await db.tasks.update_one({"id": task_id}, {"$set": update_dict})
     
     # Log action
@@ -1536,9 +1577,9 @@ async def get_ai_task_suggestions(
     if not ai_service:
         raise HTTPException(status_code=503, detail="AI service not available")
     
-    # Get current tasks and employees for analysis
-    tasks = await db.tasks.find().to_list(1000)
-    employees = await db.employees.find().to_list(1000)
+    # Sample current tasks and employees for analysis instead of loading everything
+    tasks = await db.tasks.aggregate([{"$sample": {"size": AI_SAMPLE_SIZE}}]).to_list(AI_SAMPLE_SIZE)
+    employees = await db.employees.aggregate([{"$sample": {"size": AI_SAMPLE_SIZE}}]).to_list(AI_SAMPLE_SIZE)
     
     try:
         suggestions = await ai_service.suggest_task_improvements(tasks, employees)
@@ -1566,7 +1607,7 @@ async def get_dashboard_stats(
     current_date = datetime.now(timezone.utc)
     overdue_tasks = await db.tasks.count_documents({
         "status": TaskStatus.PENDING.value,
-        "due_date": {"$lt": current_date.isoformat()}
+        "due_date": {"$lt": current_date}
     })
     
     # Get upcoming tasks (next 7 days)
@@ -1574,8 +1615,8 @@ async def get_dashboard_stats(
     upcoming_tasks = await db.tasks.count_documents({
         "status": TaskStatus.PENDING.value,
         "due_date": {
-            "$gte": current_date.isoformat(),
-            "$lte": upcoming_date.isoformat()
+            "$gte": current_date,
+            "$lte": upcoming_date
         }
     })
     
@@ -1810,23 +1851,29 @@ def generate_employee_report_pdf(employees, reports_data):
     # Employee table headers
     employee_data = [['Name', 'ID', 'Department', 'Status', 'Start Date']]
     
-    for emp in employees:
-        start_date = emp.get('start_date', '')
+    def format_start_date(start_date):
+        if isinstance(start_date, datetime):
+            return start_date.strftime('%Y-%m-%d')
         if isinstance(start_date, str) and 'T' in start_date:
             try:
-                start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00')).strftime('%Y-%m-%d')
-            except:
+                return datetime.fromisoformat(start_date.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+            except ValueError:
                 pass
-        
-        employee_data.append([
+        return str(start_date)
+    
+    employee_data.extend(
+        [
             emp.get('name', ''),
             emp.get('employee_id', ''),
             emp.get('department', ''),
             emp.get('status', '').capitalize(),
-            str(start_date)
-        ])
+            format_start_date(emp.get('start_date', ''))
+        ]
+        for emp in employees
+    )
     
-    employee_table = Table(employee_data, colWidths=[1.5*inch, 1*inch, 1.5*inch, 1*inch, 1*inch])
+    # LongTable lays out many rows in linear time across page breaks
+    employee_table = LongTable(employee_data, repeatRows=1, colWidths=[1.5*inch, 1*inch, 1.5*inch, 1*inch, 1*inch])
     employee_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -1880,6 +1927,7 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 
 # Configure logging